@@ -235,7 +235,7 @@ def _build_post_w_jd_df(
     raw_jds_df = ingest.clean_csv_to_psv_pandas(raw_jds_csv, processed_raw_psv)
 
     if raw_skills_csv and processed_skills_psv:
-        _ = ingest.clean_csv_to_psv_pandas(raw_skills_csv, processed_skills_psv)
+        ingest.clean_csv_to_psv_pandas(raw_skills_csv, processed_skills_psv, return_df=False)
 
     if logger:
         logger.info("Preprocess: robust string cleaning (postings)")
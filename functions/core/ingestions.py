@@ -2,7 +2,7 @@
 """
 functions.core.ingestions.py
 
-CSV → PSV Cleaning Utility (Pandas-based)
+CSV → PSV Cleaning Utility (PyArrow-accelerated, pandas fallback)
 
 Intent
 - Normalize and sanitize raw Lightcast-style CSV extracts that contain
@@ -13,22 +13,35 @@ Intent
 What this function does
 - Reads CSV safely:
   - Handles quoted, multi-line fields
-  - Skips malformed rows instead of failing the pipeline
+  - Skips malformed rows (too many fields) instead of failing the pipeline;
+    rows with missing fields are kept and padded with empty strings
+  - Keeps every column as raw text (no numeric/date inference)
 - Field-level normalization:
-  - Cleans ISCED_LEVELS_NAME by removing brackets, quotes, escapes, and newlines
   - Normalizes all columns by:
     - Unescaping commas
     - Removing stray backslashes
     - Flattening newlines/carriage returns
     - Stripping surrounding whitespace
-    - Converting common null tokens ([None], nan, NaN) to empty strings
-- Writes a deterministic PSV output (QUOTE_NONE, `|` separator)
+    - Converting common null tokens ([None], nan, NaN, ...) to empty strings
+  - Cleans ISCED_LEVELS_NAME by removing brackets, quotes, escapes, and newlines
+- Writes a deterministic PSV output (`|` separator, every field and header quoted,
+  `\n` line endings) — byte-identical whichever engine runs
+- Streams the file (Arrow blocks / pandas chunks): read → clean → append, so the
+  PSV can be produced for files larger than memory (return_df=False)
+
+Engines
+- PyArrow (preferred, when installed):
+  - pyarrow.csv.open_csv: streaming native tokenizer (block-wise)
+  - pyarrow.compute string kernels for cleanup (no per-cell Python calls),
+    run per column on a thread pool (kernels release the GIL)
+  - pyarrow.csv.CSVWriter for the PSV output
+- pandas (fallback when pyarrow is not importable, and for files Arrow cannot
+  treat identically: rows with missing fields, duplicate or blank header names)
 
 Design principles
 - Deterministic and non-LLM: safe for batch preprocessing and CI runs
 - Loss-minimizing: skips only irrecoverably malformed rows
-- Pandas-only implementation for portability and transparency
-- Returns the cleaned DataFrame for optional in-memory reuse
+- Returns the cleaned DataFrame for optional in-memory reuse (return_df=True)
 
 Typical usage
 - Pre-clean raw job posting exports before:
@@ -37,44 +50,243 @@ Typical usage
   - Bulk loading into analytics databases
 """
 
-import pandas as pd
+import csv
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # optional accelerator; fall back to pandas
+    pa = None
+    pc = None
+    pacsv = None
+
 
-def clean_csv_to_psv_pandas(input_file, output_file):
+_ISCED_COL = "ISCED_LEVELS_NAME"
+
+# Tokens treated as missing (pandas' default NA set + the Lightcast "[None]" marker)
+_NULL_TOKENS = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+_EMPTY_TOKENS = ["[None]", "nan", "NaN"]
+_ISCED_RE = re.compile(r'[\[\]"\\\r\n]')
+
+# Streaming granularity: Arrow block size (bytes) / pandas chunk size (rows)
+_BLOCK_SIZE = 32 << 20
+_PANDAS_CHUNK_ROWS = 100_000
+
+
+def _read_csv_header(input_file) -> List[str]:
     """
-    Clean CSV file and convert to PSV format using pandas.
-    
-    Args:
-        input_file (str): Path to input CSV file
-        output_file (str): Path to output PSV file
+    Read only the header row (used to force every column to string in Arrow).
+    """
+    with open(input_file, "r", encoding="utf-8-sig", newline="") as f:
+        return next(csv.reader(f, escapechar="\\"), [])
+
+
+def _clean_column_arrow(arr, is_isced: bool = False):
+    """
+    Clean one Arrow string column with pyarrow.compute kernels.
+    """
+    arr = pc.fill_null(arr, "")
+    arr = pc.replace_substring(arr, pattern="\\", replacement="")
+    arr = pc.replace_substring_regex(arr, pattern=r"[\r\n]", replacement=" ")
+    arr = pc.utf8_trim_whitespace(arr)
+    arr = pc.if_else(pc.is_in(arr, value_set=pa.array(_EMPTY_TOKENS)), "", arr)
+
+    if is_isced:
+        # remove brackets, quotes, newlines, backslashes
+        arr = pc.replace_substring_regex(arr, pattern=_ISCED_RE.pattern, replacement="")
+        arr = pc.utf8_trim_whitespace(arr)
+    return arr
+
+
+def _clean_batch_arrow(batch, executor=None):
+    """
+    Clean every column of one Arrow record batch.
+    Columns are independent; with an executor they are cleaned in parallel
+    (pyarrow.compute kernels release the GIL, so threads scale across cores).
+    """
+    names = batch.schema.names
+    args = ([batch.column(i) for i in range(len(names))], [name == _ISCED_COL for name in names])
+    if executor is not None:
+        columns = list(executor.map(_clean_column_arrow, *args))
+    else:
+        columns = list(map(_clean_column_arrow, *args))
+    return pa.RecordBatch.from_arrays(columns, names=names)
+
+
+class _NeedsPandasEngine(Exception):
+    """
+    Raised by the Arrow engine for inputs it cannot treat like pandas does
+    (rows with missing fields, duplicate or blank header names); the caller re-runs
+    the file with the pandas engine.
+    """
+
+
+class _InvalidRowHandler:
     """
-    # Read CSV with proper handling of quoted multi-line fields
-    df = pd.read_csv(
+    Arrow invalid-row policy matching pandas' on_bad_lines='skip':
+    skip rows with too many fields (counted), stop on short rows (pandas pads them).
+    """
+
+    def __init__(self):
+        self.skipped = 0
+        self.short_row = False
+
+    def __call__(self, row):
+        if row.actual_columns > row.expected_columns:
+            self.skipped += 1
+            return "skip"
+        self.short_row = True
+        return "error"
+
+
+def _clean_csv_to_psv_arrow(input_file, output_file, return_df=True):
+    header = _read_csv_header(input_file)
+    if len(set(header)) != len(header):
+        raise _NeedsPandasEngine("duplicate header names")
+    if "" in header:
+        raise _NeedsPandasEngine("blank header names")
+
+    on_invalid = _InvalidRowHandler()
+    try:
+        df, n_rows = _stream_csv_to_psv_arrow(input_file, output_file, header, on_invalid, return_df)
+    except pa.ArrowInvalid as e:
+        if on_invalid.short_row:
+            raise _NeedsPandasEngine("rows with missing fields") from e
+        raise
+    return df, n_rows, on_invalid.skipped
+
+
+def _stream_csv_to_psv_arrow(input_file, output_file, header, on_invalid, return_df):
+    reader = pacsv.open_csv(
+        input_file,
+        read_options=pacsv.ReadOptions(block_size=_BLOCK_SIZE),
+        parse_options=pacsv.ParseOptions(
+            quote_char='"',
+            escape_char="\\",
+            newlines_in_values=True,
+            invalid_row_handler=on_invalid,  # Skip rows with too many fields
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in header},
+            null_values=_NULL_TOKENS,
+            strings_can_be_null=True,
+        ),
+    )
+    schema = pa.schema([(name, pa.string()) for name in reader.schema.names])
+
+    # Stream: read block -> clean -> append to PSV (memory is O(block), not O(file))
+    n_rows = 0
+    kept = []
+    max_workers = max(1, min(os.cpu_count() or 1, len(schema)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, pacsv.CSVWriter(
+        output_file,
+        schema,
+        write_options=pacsv.WriteOptions(delimiter="|", quoting_style="needed"),
+    ) as writer:
+        for batch in reader:
+            cleaned = _clean_batch_arrow(batch, executor=executor)
+            writer.write_batch(cleaned)
+            n_rows += cleaned.num_rows
+            if return_df:
+                kept.append(cleaned)
+
+    df = pa.Table.from_batches(kept, schema=schema).to_pandas() if return_df else None
+    return df, n_rows
+
+
+def _clean_df_pandas(df):
+    # Clean all fields - fix escaped commas and [None] values (vectorized .str kernels).
+    # Dropping every backslash also unescapes "\," -> ",".
+    for col in df.columns:
+        s = df[col].astype("string")
+        s = s.str.replace("\\", "", regex=False)
+        s = s.str.replace(r"[\r\n]", " ", regex=True).str.strip()
+        s = s.fillna("")
+        s = s.mask(s.isin(_EMPTY_TOKENS), "")
+
+        # Clean ISCED_LEVELS_NAME - remove brackets, quotes, newlines, backslashes
+        if col == _ISCED_COL:
+            s = s.str.replace(_ISCED_RE.pattern, "", regex=True).str.strip()
+        df[col] = s.astype(object)
+    return df
+
+
+def _clean_csv_to_psv_pandas(input_file, output_file, return_df=True):
+    # Read CSV in chunks with proper handling of quoted multi-line fields
+    chunks = pd.read_csv(
         input_file,
         quoting=1,  # QUOTE_ALL
         escapechar='\\',
-        on_bad_lines='skip'  # Skip malformed lines
+        dtype=str,
+        on_bad_lines='skip',  # Skip malformed lines
+        chunksize=_PANDAS_CHUNK_ROWS,
     )
-    
-    # Clean ISCED_LEVELS_NAME - remove brackets, quotes, newlines, backslashes
-    if 'ISCED_LEVELS_NAME' in df.columns:
-        df['ISCED_LEVELS_NAME'] = df['ISCED_LEVELS_NAME'].apply(
-            lambda x: re.sub(r'[\[\]"\\n\r]', '', str(x)).strip() if pd.notna(x) else ''
+
+    n_rows = 0
+    kept = []
+    for i, chunk in enumerate(chunks):
+        chunk = _clean_df_pandas(chunk)
+        # Write as PSV (append after the first chunk)
+        chunk.to_csv(
+            output_file,
+            sep='|',
+            index=False,
+            quoting=csv.QUOTE_ALL,  # same bytes as the Arrow engine's CSVWriter
+            lineterminator='\n',
+            mode='w' if i == 0 else 'a',
+            header=(i == 0),
         )
+        n_rows += len(chunk)
+        if return_df:
+            kept.append(chunk)
+
+    df = pd.concat(kept, ignore_index=True) if return_df else None
+    return df, n_rows
+
+
+def clean_csv_to_psv_pandas(input_file, output_file, return_df=True):
+    """
+    Clean CSV file and convert to PSV format.
+
+    Uses PyArrow (native CSV reader + compute kernels) when installed,
+    otherwise falls back to the pandas implementation. Both engines stream the
+    file in blocks/chunks, so the PSV is written without holding the whole file.
     
-    # Clean all fields - fix escaped commas and [None] values
-    for col in df.columns:
-        df[col] = df[col].apply(
-            lambda x: str(x).replace('\\,', ',').replace('\\', '').replace('\n', ' ').replace('\r', ' ').strip() 
-            if pd.notna(x) else ''
-        )
-        df[col] = df[col].replace('[None]', '')
-        df[col] = df[col].replace('nan', '')
-        df[col] = df[col].replace('NaN', '')
+    Args:
+        input_file (str): Path to input CSV file
+        output_file (str): Path to output PSV file
+        return_df (bool): If False, do not keep cleaned rows in memory and return None
+                          (use for files that only need converting, or larger than RAM)
     
-    # Write as PSV
-    df.to_csv(output_file, sep='|', index=False, quoting=0)  # QUOTE_NONE for output
+    Returns:
+        pandas.DataFrame of cleaned rows (or None when return_df=False)
+    """
+    df = None
+    n_skipped = 0
+    if pa is not None:
+        try:
+            df, n_rows, n_skipped = _clean_csv_to_psv_arrow(input_file, output_file, return_df=return_df)
+        except _NeedsPandasEngine as e:
+            # e.g. short rows: pandas pads them instead of dropping; duplicate headers get ".1"
+            # suffixes, blank ones "Unnamed: {i}"
+            print(f"⚠️  {input_file} has {e}; using pandas engine")
+            df, n_rows = _clean_csv_to_psv_pandas(input_file, output_file, return_df=return_df)
+    else:
+        df, n_rows = _clean_csv_to_psv_pandas(input_file, output_file, return_df=return_df)
     
     print(f"✅ Cleaned and converted {input_file} to {output_file}")
-    print(f"   Total rows: {len(df)}")
-    return df
\ No newline at end of file
+    print(f"   Total rows: {n_rows}")
+    if n_skipped:
+        print(f"   Skipped malformed rows (too many fields): {n_skipped}")
+    return df
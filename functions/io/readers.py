@@ -11,10 +11,11 @@ Intent
 
 External calls
 - pandas.read_csv / pandas.read_excel
+- pyarrow.csv.read_csv (optional, csv/tsv/psv when use_arrow=True)
 - functions.utils.text.trim_lr (used for trimming column headers only)
 
 Primary functions
-- read_input_table(path, fmt, sheet_name=None, encoding="utf-8") -> pandas.DataFrame
+- read_input_table(path, fmt, sheet_name=None, encoding="utf-8", use_arrow=False) -> pandas.DataFrame
 - validate_required_columns(df, required_columns) -> None (raise ValueError if missing)
 
 Key behaviors / guarantees
@@ -24,6 +25,9 @@ Key behaviors / guarantees
   - csv -> ","
   - tsv -> "\\t"
   - psv -> "|"
+- **No NA detection**:
+  - csv/tsv/psv/xlsx are read with na_filter=False (pandas) or null_values=[] (Arrow):
+    every cell is kept as its raw string and the NA scanner is skipped.
 - **No cell-value trimming**:
   - This reader *intentionally* does not trim cell values to preserve traceability.
   - Only column names are trimmed defensively.
@@ -31,15 +35,27 @@ Key behaviors / guarantees
   - _trim_column_names() applies trim_lr() to each column header.
   - Helps when input headers contain leading/trailing whitespace.
 
+Arrow fast path (csv/tsv/psv)
+- use_arrow=True reads with pyarrow.csv (multithreaded native tokenizer) and returns
+  a DataFrame backed by pandas.ArrowDtype strings (one contiguous buffer per column).
+- Same values and column names as the pandas path: every column is a string, no NA
+  conversion (blanks stay as empty strings), blank headers named "Unnamed: {i}" and
+  duplicate headers renamed "x", "x.1", ... as pandas does.
+- Falls back to the pandas path when pyarrow is not installed, or when pyarrow rejects
+  the file (e.g. rows with missing or extra fields, which pandas pads or reports).
+
 Validation
 - validate_required_columns(df, required_columns):
-  - Computes missing columns by exact name match against df.columns.
+  - Computes missing columns by exact name match against df.columns (set lookup).
   - Raises ValueError with both missing and found columns for debugging.
 
 XLSX specifics
 - Uses pandas.read_excel with:
   - dtype=str
   - keep_default_na=False (so blanks stay as empty strings, not NaN)
+  - na_filter=False (skip the per-cell NA scan entirely; nothing is treated as NA)
+  - engine="calamine" when python-calamine is installed and pandas >= 2.2 (Rust-native, streams rows
+    instead of building the openpyxl workbook object graph); otherwise pandas' default.
 - Default sheet name is **"sheet1"** unless overridden by sheet_name.
   - Note: in many Excel files the default sheet is "Sheet1" (capital S).
     This implementation is strict; if the sheet is actually "Sheet1" you must pass it explicitly.
@@ -56,8 +72,10 @@ Where this fits in the pipeline
 
 from __future__ import annotations
 
+import csv
+import importlib.util
 from pathlib import Path
-from typing import Iterable, List, Literal, Optional
+from typing import Dict, Iterable, List, Literal, Optional
 
 import pandas as pd
 
@@ -72,13 +90,19 @@ _DELIMS = {
     "psv": "|",
 }
 
+# Prefer the calamine XLSX engine when available (pandas added engine="calamine" in 2.2)
+_PANDAS_VERSION = tuple(int(x) for x in pd.__version__.split(".")[:2] if x.isdigit())
+_XLSX_ENGINE: Optional[str] = (
+    "calamine" if _PANDAS_VERSION >= (2, 2) and importlib.util.find_spec("python_calamine") else None
+)
+
 
 def validate_required_columns(df: pd.DataFrame, required_columns: Iterable[str]) -> None:
     """
     Raise ValueError if any required column is missing.
     """
-    required = list(required_columns)
-    missing = [c for c in required if c not in df.columns]
+    cols = frozenset(df.columns)
+    missing = [c for c in required_columns if c not in cols]
     if missing:
         raise ValueError(f"Missing required columns: {missing}. Found columns: {list(df.columns)}")
 
@@ -86,17 +110,85 @@ def validate_required_columns(df: pd.DataFrame, required_columns: Iterable[str])
 def _trim_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Defensive: strip whitespace around column names only.
+    Relabels in place (metadata-only; cell data is never copied) — callers pass
+    a freshly read frame. No-op when headers are already clean.
     """
-    df = df.copy()
-    df.columns = [trim_lr(str(c)) for c in df.columns]
+    new_cols = [trim_lr(str(c)) for c in df.columns]
+    if list(df.columns) != new_cols:
+        df.columns = new_cols
     return df
 
 
+def _dedupe_column_names(names: List[str]) -> List[str]:
+    """
+    Name the header exactly like pandas.read_csv (C parser): blank cells become
+    "Unnamed: {i}", then duplicates are renamed "x", "x.1", "x.2", ... (named columns
+    first, unnamed last), skipping suffixes that collide with a name in the header.
+    """
+    out = list(names)
+    unnamed = []
+    for i, col in enumerate(out):
+        if col == "":
+            out[i] = f"Unnamed: {i}"
+            unnamed.append(i)
+
+    blank = set(unnamed)
+    counts: Dict[str, int] = {}
+    for i in [i for i in range(len(out)) if i not in blank] + unnamed:
+        col = base = out[i]
+        cur = counts.get(col, 0)
+        while cur > 0:
+            counts[base] = cur + 1
+            col = f"{base}.{cur}"
+            cur = cur + 1 if col in out else counts.get(col, 0)
+        out[i] = col
+        counts[col] = cur + 1
+    return out
+
+
+def _read_delimited_arrow(p: Path, delim: str, encoding: str) -> Optional[pd.DataFrame]:
+    """
+    Read csv/tsv/psv via pyarrow.csv into an Arrow-backed DataFrame.
+    Returns None when pyarrow is not installed or cannot read the file the way pandas
+    does (caller falls back to pandas).
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+
+    # Peek the header so every column is read as string (matches dtype=str)
+    with p.open("r", encoding=encoding, newline="") as f:
+        header = next(csv.reader(f, delimiter=delim), [])
+    if header:
+        header[0] = header[0].lstrip("\ufeff")  # pyarrow drops a UTF-8 BOM itself
+    header = _dedupe_column_names(header)
+
+    try:
+        table = pacsv.read_csv(
+            p,
+            read_options=pacsv.ReadOptions(encoding=encoding, column_names=header, skip_rows=1 if header else 0),
+            parse_options=pacsv.ParseOptions(delimiter=delim, newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                null_values=[],
+                strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid:
+        # e.g. rows with a different field count: pandas pads short rows / raises on long
+        # ones, so let the caller read the file with pandas
+        return None
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def read_input_table(
     path: str | Path,
     fmt: InputFormat,
     sheet_name: Optional[str] = None,
     encoding: str = "utf-8",
+    use_arrow: bool = False,
 ) -> pd.DataFrame:
     """
     Read an input table from csv/tsv/psv/xlsx.
@@ -105,6 +197,8 @@ def read_input_table(
     - This function DOES NOT trim cell values (to preserve traceability).
       Value trimming/dedup occurs in pipeline_0 according to parameters.yaml.
     - Column names are trimmed defensively.
+    - use_arrow=True (csv/tsv/psv only) reads via pyarrow and returns Arrow-backed
+      string columns; falls back to pandas if pyarrow is unavailable or rejects the file.
     """
     p = Path(path)
     if not p.exists():
@@ -113,12 +207,18 @@ def read_input_table(
     fmt = fmt.lower().strip()  # type: ignore[assignment]
     if fmt in ("csv", "tsv", "psv"):
         delim = _DELIMS[fmt]  # type: ignore[index]
-        df = pd.read_csv(p, sep=delim, encoding=encoding, dtype=str, keep_default_na=False)
+        if use_arrow:
+            df = _read_delimited_arrow(p, delim, encoding)
+            if df is not None:
+                return _trim_column_names(df)
+        df = pd.read_csv(p, sep=delim, encoding=encoding, dtype=str, keep_default_na=False, na_filter=False)
         return _trim_column_names(df)
 
     if fmt == "xlsx":
         sheet = sheet_name or "sheet1"
-        df = pd.read_excel(p, sheet_name=sheet, dtype=str, keep_default_na=False)
+        df = pd.read_excel(
+            p, sheet_name=sheet, dtype=str, keep_default_na=False, na_filter=False, engine=_XLSX_ENGINE
+        )
         return _trim_column_names(df)
 
     raise ValueError(f"Unsupported input format: {fmt}. Expected one of: csv|tsv|psv|xlsx")
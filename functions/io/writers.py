@@ -10,14 +10,15 @@ Intent
 - Centralize directory creation and logging for all write operations.
 
 External calls
-- json.dumps
+- orjson.dumps (optional, preferred) / json.dumps (fallback)
 - pandas.DataFrame.to_csv
+- pyarrow.csv.write_csv (optional, for Arrow-backed DataFrames)
 - pathlib.Path
 - functions.utils.logging.get_logger
 
 Primary functions
 - ensure_parent_dir(path) -> None
-- write_jsonl(path, records) -> None
+- write_jsonl(path, records) -> int (rows written; records may be any iterable/generator)
 - write_csv(path, df) -> None
 
 Key behaviors / guarantees
@@ -27,15 +28,30 @@ Key behaviors / guarantees
     - UTF-8 encoding
     - sort_keys=True to ensure stable key ordering
     - ensure_ascii=False to preserve Thai / Unicode text
+    - compact separators; NaN/Infinity written as null
+    - records orjson cannot encode (e.g. numpy floats, ints wider than 64 bits) are
+      written with stdlib json instead, as before
+    - orjson and stdlib json agree for str-keyed records of str/int/bool/None/list
+      values. They can differ in the order of non-str keys ({10:..., 2:...}) and in
+      float exponent form (1e16 vs 1e+16).
+    - orjson path buffers output and writes in large chunks (few syscalls)
+    - stdlib path joins 10k-record groups into one write() on a 1MB-buffered file
   - CSV:
     - UTF-8 encoding
     - index=False
     - Column order is exactly df.columns (caller-controlled)
+    - Explicitly Arrow-typed frames (pd.ArrowDtype / "string[pyarrow]", e.g. from
+      read_input_table(use_arrow=True)) are written via pyarrow.csv, which quotes every
+      string value and header; all other frames (incl. pandas 3 default "str") use
+      pandas with minimal quoting
 
 - **Filesystem safety**
   - ensure_parent_dir() is called automatically before writing.
   - Parent directories are created recursively and idempotently.
   - Safe to call repeatedly across pipeline stages.
+  - Directories already ensured by this process are remembered (by absolute path), so
+    repeated writes into the same folder skip the exists/mkdir calls. If such a directory
+    is removed mid-process, the next write recreates it once and retries.
 
 - **Observability**
   - All write operations emit INFO-level logs with:
@@ -63,43 +79,183 @@ Typical usage
 from __future__ import annotations
 
 import json
+import math
+import os
+import threading
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Sequence
+from typing import Any, Dict, Iterable, Mapping
 
 import pandas as pd
 
 from functions.utils.logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to stdlib json
+    orjson = None
+
+
+_ORJSON_OPTS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE) if orjson else 0
+_JSON_SEPARATORS = (",", ":")  # match orjson's compact output
+
+# Flush the JSONL buffer once it reaches this size (bounds peak memory)
+_WRITE_CHUNK_BYTES = 64 << 20
+
+# stdlib json fallback: encode/write this many records per write() call
+_JSON_GROUP_RECORDS = 10_000
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# Parent directories already ensured by this process
+_ENSURED_DIRS: set[str] = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
+
+
+def _non_finite_to_none(obj: Any) -> Any:
+    """
+    Replace NaN/Infinity floats with None (recursively), as orjson does.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, Mapping):
+        return {k: _non_finite_to_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_non_finite_to_none(v) for v in obj]
+    return obj
+
+
+def _json_dumps_line(rec: Mapping[str, Any]) -> str:
+    """
+    stdlib json encoding with the orjson path's layout (compact, sorted, NaN/Infinity -> null).
+    """
+    try:
+        return json.dumps(rec, ensure_ascii=False, sort_keys=True, separators=_JSON_SEPARATORS, allow_nan=False)
+    except ValueError:
+        # rare: record holds NaN/Infinity; only then pay for the recursive rewrite
+        return json.dumps(
+            _non_finite_to_none(rec), ensure_ascii=False, sort_keys=True, separators=_JSON_SEPARATORS
+        )
+
 
 def ensure_parent_dir(path: str | Path) -> None:
     """
     Ensure parent directory exists for the given file path.
-    Idempotent and safe.
+    Idempotent and safe; each directory is created/checked at most once per process
+    (keyed by its absolute path, so os.chdir() cannot alias entries).
     """
-    p = Path(path)
-    parent = p.parent
-    if parent and not parent.exists():
-        parent.mkdir(parents=True, exist_ok=True)
+    parent = os.path.dirname(os.fspath(path))
+    key = os.path.abspath(parent)
+    if key in _ENSURED_DIRS:
+        return
+
+    if parent:
+        Path(parent).mkdir(parents=True, exist_ok=True)
+    with _ENSURED_DIRS_LOCK:
+        _ENSURED_DIRS.add(key)
+
+
+def _forget_parent_dir(path: str | Path) -> None:
+    with _ENSURED_DIRS_LOCK:
+        _ENSURED_DIRS.discard(os.path.abspath(os.path.dirname(os.fspath(path))))
 
 
-def write_jsonl(path: str | Path, records: Sequence[Mapping[str, Any]]) -> None:
+def _open_for_write(p: Path, mode: str, **kwargs: Any):
+    """
+    Open p for writing; if its (previously ensured) parent was removed meanwhile,
+    drop the cache entry, recreate the directory and retry once.
+    """
+    try:
+        return p.open(mode, **kwargs)
+    except FileNotFoundError:
+        _forget_parent_dir(p)
+        ensure_parent_dir(p)
+        return p.open(mode, **kwargs)
+
+
+def write_jsonl(path: str | Path, records: Iterable[Mapping[str, Any]]) -> int:
     """
     Write records to JSONL deterministically:
     - UTF-8
     - One JSON object per line
     - sort_keys=True for stable output
     - ensure_ascii=False to preserve Thai text
+
+    records may be any iterable (e.g. a generator); it is consumed once while
+    streaming, never materialized. Returns the number of rows written.
     """
     logger = get_logger(__name__)
     ensure_parent_dir(path)
 
     p = Path(path)
-    with p.open("w", encoding="utf-8") as f:
-        for rec in records:
-            line = json.dumps(rec, ensure_ascii=False, sort_keys=True)
-            f.write(line + "\n")
+    count = 0
+    if orjson is not None:
+        buf = bytearray()
+        with _open_for_write(p, "wb") as f:
+            for rec in records:
+                try:
+                    buf += orjson.dumps(rec, option=_ORJSON_OPTS)
+                except orjson.JSONEncodeError:
+                    # e.g. numpy scalars / >64-bit ints: stdlib json handles what it did before
+                    buf += _json_dumps_line(rec).encode("utf-8") + b"\n"
+                count += 1
+                if len(buf) >= _WRITE_CHUNK_BYTES:
+                    f.write(buf)
+                    buf.clear()
+            f.write(buf)
+    else:
+        it = iter(records)
+        with _open_for_write(p, "w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES) as f:
+            while True:
+                lines = [_json_dumps_line(rec) for rec in islice(it, _JSON_GROUP_RECORDS)]
+                if not lines:
+                    break
+                f.write("\n".join(lines))
+                f.write("\n")
+                count += len(lines)
 
-    logger.info("Wrote JSONL: %s (rows=%d)", str(p), len(records))
+    logger.info("Wrote JSONL: %s (rows=%d)", str(p), count)
+    return count
+
+
+def _is_arrow_backed(df: pd.DataFrame) -> bool:
+    """
+    True if every column is explicitly Arrow-typed: pd.ArrowDtype or "string[pyarrow]"
+    (StringDtype with pd.NA). pandas 3's default "str" dtype is also pyarrow-backed
+    (na_value=nan) but is treated as a plain frame, so default output never changes.
+    """
+    if df.shape[1] == 0:
+        return False
+    for dt in df.dtypes:
+        if isinstance(dt, pd.ArrowDtype):
+            continue
+        if isinstance(dt, pd.StringDtype) and dt.storage == "pyarrow" and dt.na_value is pd.NA:
+            continue
+        return False
+    return True
+
+
+def _write_csv_arrow(p: Path, df: pd.DataFrame) -> bool:
+    """
+    Write an Arrow-backed DataFrame with pyarrow.csv (no per-cell Python objects).
+    Returns False if pyarrow is unavailable or cannot convert the frame.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return False
+
+    try:
+        tbl = pa.Table.from_pandas(df, preserve_index=False)
+        pacsv.write_csv(tbl, str(p))
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return False
+    return True
+
+
+def _write_csv_any(p: Path, df: pd.DataFrame) -> None:
+    if not (_is_arrow_backed(df) and _write_csv_arrow(p, df)):
+        df.to_csv(p, index=False, encoding="utf-8")
 
 
 def write_csv(path: str | Path, df: pd.DataFrame) -> None:
@@ -108,12 +264,27 @@ def write_csv(path: str | Path, df: pd.DataFrame) -> None:
     - UTF-8
     - index=False
     - stable column order as df.columns
+    - Arrow-backed frames (pd.ArrowDtype / "string[pyarrow]" columns) go through
+      pyarrow.csv; everything else through pandas
+
+    Note: the Arrow path uses a different CSV layout — every string value and header
+    is quoted ("a","b" / "x","1") — whereas pandas quotes only where needed (a,b / x,1).
+    Both parse back to the same table.
     """
     logger = get_logger(__name__)
     ensure_parent_dir(path)
 
     p = Path(path)
-    df.to_csv(p, index=False, encoding="utf-8")
+    try:
+        _write_csv_any(p, df)
+    except OSError:
+        # parent removed since it was first ensured (pandas raises a plain OSError,
+        # open() FileNotFoundError): recreate once and retry
+        if p.parent.exists():
+            raise
+        _forget_parent_dir(p)
+        ensure_parent_dir(p)
+        _write_csv_any(p, df)
 
     logger.info("Wrote CSV: %s (rows=%d, cols=%d)", str(p), int(df.shape[0]), int(df.shape[1]))
 
@@ -10,9 +10,13 @@ Intent
 
 What this module guarantees
 - **Safe prompt loading:** every template loaded from YAML is sanitized to replace common
-  non-ASCII whitespace characters with regular spaces and normalize CRLF → LF.
-- **Deterministic rendering:** rendering uses `str.format(**variables)` and expects callers to
-  inject pre-serialized JSON (preferably with stable key ordering).
+  non-ASCII whitespace characters with regular spaces (one `str.translate` pass) and
+  normalize CRLF → LF.
+- **Deterministic rendering:** rendering follows `str.format(**variables)` semantics and expects
+  callers to inject pre-serialized JSON (preferably with stable key ordering).
+- **Pre-compiled templates:** each template is parsed once, on first render, into
+  literal/placeholder parts (cached), so repeated renders only join strings instead of
+  re-parsing the template. Malformed templates fail at render time, as with `str.format`.
 - **Clear failures:** missing template variables raise a `KeyError` that explicitly names the
   missing placeholder.
 
@@ -21,30 +25,44 @@ Primary functions
   Loads templates via `functions.utils.config.load_prompts()` and sanitizes each template.
 
 - `render_prompt(template: str, variables: Dict[str, Any]) -> str`
-  Renders templates using `str.format`. Raises a clear error for missing variables.
+  Renders templates from their cached compiled form (plain `{name}` placeholders), falling
+  back to `str.format` for format specs / conversions / attribute access.
+  Raises a clear error for missing variables.
 
 - `build_variables_for_common_enums(params) -> Dict[str, str]`
   Convenience helper to convert common parameter enum lists into stable JSON strings.
 
 Notes & usage conventions
 - Prefer injecting structured objects as JSON strings created with stable serialization:
-  - `json.dumps(obj, ensure_ascii=False, sort_keys=True)`
+  - `_json_dumps_stable(obj)` (orjson with sorted keys when installed; otherwise, or for
+    values orjson rejects, `json.dumps(obj, ensure_ascii=False, sort_keys=True,
+    separators=(",", ":"))`; NaN/Infinity become null on both paths. Output is the same
+    for str-keyed data; non-str key order and float exponent form can differ)
   This avoids non-deterministic ordering and reduces diff noise in cached runs.
 - Sanitization is intentionally conservative: it only normalizes whitespace known to cause
   YAML/indentation issues; it does not attempt to “fix” prompt content beyond that.
 
 External dependencies
 - `functions.utils.config.load_prompts`
-- Python stdlib: `json`, `str.format`
+- Python stdlib: `json`, `string.Formatter`, `functools.lru_cache`
+- Optional: `orjson` (faster stable JSON serialization)
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any, Dict
+import string
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+from functions.io.writers import _non_finite_to_none
 from functions.utils.config import load_prompts
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; fall back to stdlib json
+    orjson = None
+
 
 # Unicode spaces that commonly break YAML / indentation
 _BAD_WHITESPACE = {
@@ -53,6 +71,12 @@ _BAD_WHITESPACE = {
     "\u202F",  # NARROW NO-BREAK SPACE
     "\uFEFF",  # BOM
 }
+_BAD_WHITESPACE_TRANS = str.maketrans(dict.fromkeys(_BAD_WHITESPACE, " "))
+
+_FORMATTER = string.Formatter()
+
+# Compiled template: ((literal, field_name_or_None), ...)
+CompiledTemplate = Tuple[Tuple[str, Optional[str]], ...]
 
 
 def _sanitize_prompt_text(text: str) -> str:
@@ -63,11 +87,12 @@ def _sanitize_prompt_text(text: str) -> str:
     if not isinstance(text, str):
         return text
 
-    for ch in _BAD_WHITESPACE:
-        text = text.replace(ch, " ")
+    text = text.translate(_BAD_WHITESPACE_TRANS)
 
-    # Also normalize CRLF just in case
-    return text.replace("\r\n", "\n")
+    # Also normalize CRLF just in case (skip the extra pass when there is no CR)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    return text
 
 
 def load_prompt_templates(path: str = "configs/prompts.yaml") -> Dict[str, str]:
@@ -85,25 +110,62 @@ def load_prompt_templates(path: str = "configs/prompts.yaml") -> Dict[str, str]:
     return clean
 
 
+@lru_cache(maxsize=64)
+def _compile_template(template: str) -> Optional[CompiledTemplate]:
+    """
+    Parse a template once into (literal, field_name) parts using str.format's own parser
+    (so `{{` / `}}` escapes behave identically).
+    Returns None if any placeholder uses a format spec, conversion, attribute/index access,
+    or positional field; such templates are rendered with str.format instead.
+    """
+    parts = []
+    for literal, field, spec, conversion in _FORMATTER.parse(template):
+        if field is not None and (not field.isidentifier() or spec or conversion):
+            return None
+        parts.append((literal, field))
+    return tuple(parts)
+
+
 def _json_dumps_stable(obj: Any) -> str:
     """
     Stable JSON serializer for prompt injection:
     - sort_keys=True for deterministic ordering
     - ensure_ascii=False for Thai text
+    - compact separators; NaN/Infinity -> null
+    - orjson when installed; stdlib json otherwise, and for values orjson rejects
+      (e.g. numpy floats, ints wider than 64 bits)
     """
-    return json.dumps(obj, ensure_ascii=False, sort_keys=True)
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    try:
+        return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        return json.dumps(_non_finite_to_none(obj), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
 
 
 def render_prompt(template: str, variables: Dict[str, Any]) -> str:
     """
-    Render a prompt template using Python str.format(**variables).
+    Render a prompt template with Python str.format(**variables) semantics.
 
     Rules:
     - Deterministic: caller should pass JSON strings or use json.dumps stable helpers.
     - Raises KeyError with a clear message if any variable is missing.
+    - Uses the cached compiled form of the template (parsed once per template).
     """
     try:
-        return template.format(**variables)
+        compiled = _compile_template(template)
+        if compiled is None:
+            return template.format(**variables)
+
+        out = []
+        for literal, field in compiled:
+            out.append(literal)
+            if field is not None:
+                out.append(format(variables[field]))
+        return "".join(out)
     except KeyError as e:
         missing = str(e).strip("'")
         raise KeyError(f"Missing template variable: {missing}") from e
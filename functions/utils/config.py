@@ -19,6 +19,7 @@ What this module guarantees
   - `input` -> `inputs` remap (singular -> plural)
   - `llm.max_rows_per_run` accepts: null / "all" / int / numeric string
 - **Deterministic defaults:** if a key is omitted, model defaults apply.
+- **Immutable configs:** returned models are frozen; attribute assignment raises.
 
 Config models (high level)
 - ProjectConfig:
@@ -67,6 +68,13 @@ Primary functions
 
 Implementation notes / gotchas
 - `_load_yaml()` enforces that YAML root is a mapping/object; otherwise raises.
+- `_load_yaml()` memoizes parsed files keyed on (resolved path, mtime_ns, size), so
+  repeated loads of an unchanged file skip the read + parse. Callers receive a deep
+  copy, so mutating the returned dict never affects the cache.
+- Large YAML files (>= 64KB) are decoded directly from an mmap of the file.
+- All config models are frozen (immutable). `load_parameters()` / `load_credentials()`
+  therefore cache the validated objects per file version and return the same instance
+  until the file changes; use `model_copy(update=...)` to derive a modified config.
 - `load_prompts()` is “legacy”: it requires `meta` and `prompts` mappings (strict).
 - `OutputsConfig` default output paths currently use:
   - "artifacts/job_postings_dq_eval.jsonl"
@@ -75,7 +83,8 @@ Implementation notes / gotchas
   (either adjust defaults here or in the pipeline’s output resolution logic).
 
 External dependencies
-- PyYAML: yaml.safe_load
+- PyYAML: yaml.load with CSafeLoader (libyaml C backend); falls back to the pure-Python
+  SafeLoader (with a one-time warning) when PyYAML was built without libyaml
 - Pydantic v2: BaseModel, validators, model_validate
 - Local: functions.utils.logging.get_logger
 """
@@ -83,24 +92,45 @@ External dependencies
 
 from __future__ import annotations
 
+import copy
+import mmap
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, Tuple
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator, model_validator
 
 from functions.utils.logging import get_logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+_WITH_LIBYAML = bool(getattr(yaml, "__with_libyaml__", False)) and _YamlLoader is not yaml.SafeLoader
+_LIBYAML_WARNED = False
+
+# NBSP / figure space / narrow NBSP / BOM -> ASCII space (single str.translate pass)
+_BAD_WHITESPACE_TRANS = str.maketrans(dict.fromkeys("\u00A0\u2007\u202F\uFEFF", " "))
+
+# YAML files at least this large are read via mmap (smaller ones: not worth the setup)
+_MMAP_MIN_BYTES = 64 * 1024
+
 
 # -----------------------------
 # Parameter models (THIS project)
 # -----------------------------
 class ProjectConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = "job_posting_dq"
     timezone: str = "Asia/Bangkok"
 
 
 class InputsConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     # raw sources
     raw_postings_csv: str = "raw_data/Thailand_global_postings.csv"
     raw_jds_csv: str = "raw_data/Thailand_global_raw.csv"
@@ -113,6 +143,8 @@ class InputsConfig(BaseModel):
 
 
 class LLMConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     model_name: str = "gemini-2.5-flash"
     temperature: float = 0.3
 
@@ -192,6 +224,8 @@ class LLMConfig(BaseModel):
 
 
 class OutputsConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     artifacts_dir: str = "artifacts"
     cache_dir: str = "artifacts/cache"
     reports_dir: str = "artifacts/reports"
@@ -202,6 +236,8 @@ class OutputsConfig(BaseModel):
 
 
 class ParametersConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     project: ProjectConfig = Field(default_factory=ProjectConfig)
     inputs: InputsConfig = Field(default_factory=InputsConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
@@ -237,12 +273,16 @@ class ParametersConfig(BaseModel):
 # Credentials models (same as before)
 # -----------------------------
 class CredentialsGeminiRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     timeout_seconds: int = 60
     retry_backoff_seconds: int = 2
     max_retry_backoff_seconds: int = 20
 
 
 class CredentialsGemini(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     api_key_env: str = "GEMINI_API_KEY"
     gcp_project_id: Optional[str] = None
     gcp_location: Optional[str] = None
@@ -250,39 +290,76 @@ class CredentialsGemini(BaseModel):
 
 
 class CredentialsConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     gemini: CredentialsGemini = Field(default_factory=CredentialsGemini)
 
 
 # -----------------------------
 # YAML helpers
 # -----------------------------
-def _load_yaml(path: str) -> Dict[str, Any]:
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file once per (path, mtime_ns, size). Do not mutate the result.
+    """
+    global _LIBYAML_WARNED
+
+    p = Path(path)
+    if size >= _MMAP_MIN_BYTES:
+        # large files: decode straight from the OS page cache (no intermediate bytes copy)
+        with p.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+    else:
+        with p.open("r", encoding="utf-8") as f:
+            text = f.read()
+
+    # sanitize BEFORE YAML parse (fix NBSP / BOM / narrow NBSP) in one pass
+    text = text.translate(_BAD_WHITESPACE_TRANS)
+
+    if not _WITH_LIBYAML and not _LIBYAML_WARNED:
+        get_logger(__name__).warning("PyYAML libyaml backend unavailable; using pure-Python SafeLoader")
+        _LIBYAML_WARNED = True
+
+    data = yaml.load(text, Loader=_YamlLoader) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"YAML root must be a mapping/object: {path}")
+    return data
+
+
+def _yaml_cache_key(path: str) -> Tuple[str, int, int]:
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"YAML file not found: {path}")
 
-    with p.open("r", encoding="utf-8") as f:
-        text = f.read()
+    st = p.stat()
+    return str(p.resolve()), st.st_mtime_ns, st.st_size
 
-    # sanitize BEFORE YAML parse (fix NBSP / BOM / narrow NBSP)
-    for ch in ["\u00A0", "\u2007", "\u202F", "\uFEFF"]:
-        text = text.replace(ch, " ")
 
-    data = yaml.safe_load(text) or {}
-    if not isinstance(data, dict):
-        raise ValueError(f"YAML root must be a mapping/object: {path}")
-    return data
+def _load_yaml(path: str) -> Dict[str, Any]:
+    data = _load_yaml_cached(*_yaml_cache_key(path))
+    return copy.deepcopy(data)
+
+
+@lru_cache(maxsize=8)
+def _load_parameters_cached(path: str, mtime_ns: int, size: int) -> ParametersConfig:
+    raw = copy.deepcopy(_load_yaml_cached(path, mtime_ns, size))
+    return ParametersConfig.model_validate(raw)
 
 
+@lru_cache(maxsize=8)
+def _load_credentials_cached(path: str, mtime_ns: int, size: int) -> CredentialsConfig:
+    raw = copy.deepcopy(_load_yaml_cached(path, mtime_ns, size))
+    return CredentialsConfig.model_validate(raw)
+
 
 def load_parameters(path: str = "configs/parameters.yaml") -> ParametersConfig:
     """
     Load and validate parameters.yaml into a typed ParametersConfig (job posting DQ).
     """
     logger = get_logger(__name__)
-    raw = _load_yaml(path)
     try:
-        params = ParametersConfig.model_validate(raw)
+        params = _load_parameters_cached(*_yaml_cache_key(path))
     except ValidationError as e:
         logger.error("Invalid parameters.yaml: %s", e)
         raise
@@ -336,9 +413,8 @@ def load_credentials(path: str = "configs/credentials.yaml") -> CredentialsConfi
     Load and validate credentials.yaml into a typed CredentialsConfig.
     """
     logger = get_logger(__name__)
-    raw = _load_yaml(path)
     try:
-        creds = CredentialsConfig.model_validate(raw)
+        creds = _load_credentials_cached(*_yaml_cache_key(path))
     except ValidationError as e:
         logger.error("Invalid credentials.yaml: %s", e)
         raise